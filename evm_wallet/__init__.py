@@ -20,7 +20,35 @@ Usage example:
 :license: MIT, see LICENSE for more details.
 """
 
-from .wallet import Wallet
-from .async_wallet import AsyncWallet
+from importlib import import_module
+from typing import TYPE_CHECKING
 from .types import NetworkInfo, ERC20Token
-from ._base_wallet import ZERO_ADDRESS
+
+if TYPE_CHECKING:
+    from .wallet import Wallet
+    from .async_wallet import AsyncWallet
+    from ._base_wallet import ZERO_ADDRESS
+
+__all__ = ['Wallet', 'AsyncWallet', 'NetworkInfo', 'ERC20Token', 'ZERO_ADDRESS']
+
+# web3 takes most of the import time, so the modules depending on it are imported on first access
+_LAZY_ATTRIBUTES = {
+    'Wallet': '.wallet',
+    'AsyncWallet': '.async_wallet',
+    'ZERO_ADDRESS': '._base_wallet',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,206 +1,176 @@
-import os
-import json
+from collections import OrderedDict
 from functools import lru_cache
-from typing import ClassVar, cast, Self, Optional
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Sequence, cast, get_args, Self, Optional
 from eth_account import Account
-from eth_typing import ChecksumAddress, HexStr
+from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress, HexAddress, HexStr
 from abc import ABC, abstractmethod
 from hexbytes import HexBytes
 from web3 import AsyncWeb3, Web3
 from web3.contract.contract import ContractFunction, Contract
+from web3.middleware import construct_simple_cache_middleware
 from web3.contract.async_contract import AsyncContract, AsyncContractFunction
-from web3.types import ABI, Wei, TxParams
+from web3.types import ABI, Wei, TxParams, RPCEndpoint, RPCResponse
 from evm_wallet.types import Network, NetworkInfo, AnyAddress, TokenAmount, ERC20Token
-from evm_wallet.utils import _in_literal, _is_network_info
-
-ZERO_ADDRESS = Web3.to_checksum_address("0x0000000000000000000000000000000000000000")
+from evm_wallet.utils import _is_network_info, _checksum, _as_str
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# The zero address has no letters, so it is its own checksum
+ZERO_ADDRESS = ChecksumAddress(HexAddress(HexStr("0x0000000000000000000000000000000000000000")))
+_ZERO_ADDRESS_BYTES = bytes(20)
+
+_ERC20_ABI: ABI = _json_loads((Path(__file__).parent / 'erc20.abi').read_bytes())
+
+# Multicall3 is deployed at the same address on most EVM chains, see https://www.multicall3.com
+MULTICALL3_ADDRESS = ChecksumAddress(HexAddress(HexStr("0xcA11bde05977b3631167028862bE2a173976CA11")))
+_MULTICALL3_ABI: ABI = [{
+    'name': 'aggregate3',
+    'type': 'function',
+    'stateMutability': 'payable',
+    'inputs': [{
+        'name': 'calls',
+        'type': 'tuple[]',
+        'components': [
+            {'name': 'target', 'type': 'address'},
+            {'name': 'allowFailure', 'type': 'bool'},
+            {'name': 'callData', 'type': 'bytes'}
+        ]
+    }],
+    'outputs': [{
+        'name': 'returnData',
+        'type': 'tuple[]',
+        'components': [
+            {'name': 'success', 'type': 'bool'},
+            {'name': 'returnData', 'type': 'bytes'}
+        ]
+    }]
+}]
+
+
+@lru_cache(maxsize=1024)
+def _account_from_key(private_key: str | bytes) -> tuple[LocalAccount, ChecksumAddress]:
+    account = Account.from_key(private_key)
+    return account, _checksum(account.address)
+
+
+async def _async_chain_id_cache_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any],
+        async_w3: AsyncWeb3
+) -> Callable[[RPCEndpoint, Any], Awaitable[RPCResponse]]:
+    # web3 constructs its async cache middleware only by awaiting, so an equivalent for eth_chainId is defined here
+    chain_id_response: Optional[RPCResponse] = None
+
+    async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        nonlocal chain_id_response
+
+        if method != 'eth_chainId':
+            return await make_request(method, params)
+
+        if chain_id_response is None:
+            response = await make_request(method, params)
+
+            if 'result' not in response:
+                return response
+
+            chain_id_response = response
+
+        return chain_id_response
+
+    return middleware
+
+
+def _create_provider(rpc: str, is_async: bool) -> AsyncWeb3 | Web3:
+    # Every wallet gets its own provider, so middleware and settings of one wallet never affect another, while web3
+    # still shares HTTP sessions between providers of the same RPC. The cache middleware keeps web3 from requesting
+    # eth_chainId on every contract call and transaction build. Nothing else is cached, since other responses, such as
+    # pending transactions, change over time
+    if is_async:
+        provider = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc))
+        provider.middleware_onion.add(_async_chain_id_cache_middleware, 'chain_id_cache')
+    else:
+        provider = Web3(Web3.HTTPProvider(rpc))
+        provider.middleware_onion.add(
+            construct_simple_cache_middleware(rpc_whitelist={RPCEndpoint('eth_chainId')}),
+            'chain_id_cache'
+        )
+
+    return provider
+
+
+@lru_cache(maxsize=64)
+def _load_multicall_contract(provider: AsyncWeb3 | Web3) -> AsyncContract | Contract:
+    return provider.eth.contract(address=MULTICALL3_ADDRESS, abi=_MULTICALL3_ABI)
+
+
+@lru_cache(maxsize=512)
+def _load_erc20_contract(provider: AsyncWeb3 | Web3, address: ChecksumAddress) -> AsyncContract | Contract:
+    # Keyed on the provider itself, so switching the network of a wallet never returns a contract of the old chain
+    return provider.eth.contract(address=address, abi=_ERC20_ABI)
+
+
+# name, chain id, rpc, native token, explorer
+_NETWORKS: tuple[tuple[Network, int, str, str, str], ...] = (
+    ('Arbitrum Goerli', 421613, 'https://arbitrum-goerli-rpc.publicnode.com', 'ETH', 'https://goerli.arbiscan.io'),
+    ('Arbitrum Sepolia', 421614, 'https://arbitrum-sepolia-rpc.publicnode.com', 'ETH', 'https://sepolia.arbiscan.io'),
+    ('Arbitrum', 42161, 'https://arbitrum-one-rpc.publicnode.com', 'ETH', 'https://arbiscan.io'),
+    ('Avalanche', 43114, 'https://avalanche-c-chain-rpc.publicnode.com', 'AVAX', 'https://snowtrace.io/'),
+    ('Base', 8453, 'https://base-rpc.publicnode.com', 'ETH', 'https://basescan.org/'),
+    ('Base Goerli', 84531, 'https://base-goerli.public.blastapi.io', 'ETH', 'https://goerli.basescan.org/'),
+    ('Base Sepolia', 84532, 'https://base-sepolia-rpc.publicnode.com', 'ETH', 'https://sepolia.basescan.org/'),
+    ('BSC', 56, 'https://bsc-rpc.publicnode.com', 'BNB', 'https://bscscan.com'),
+    ('BSC Testnet', 97, 'https://bsc-testnet-rpc.publicnode.com', 'BNB', 'https://testnet.bscscan.com'),
+    ('Ethereum', 1, 'https://ethereum-rpc.publicnode.com', 'ETH', 'https://etherscan.io'),
+    ('Fantom', 250, 'https://fantom-rpc.publicnode.com', 'FTM', 'https://ftmscan.com/'),
+    ('Fantom Testnet', 4002, 'https://fantom-testnet-rpc.publicnode.com', 'FTM', 'https://testnet.ftmscan.com/'),
+    ('Fuji', 43113, 'https://avalanche-fuji-c-chain-rpc.publicnode.com', 'AVAX', 'https://testnet.snowtrace.io'),
+    ('Goerli', 5, 'https://goerli.gateway.tenderly.co', 'ETH', 'https://goerli.etherscan.io'),
+    ('Linea', 59144, 'https://linea.drpc.org', 'ETH', 'https://lineascan.build/'),
+    ('Linea Goerli', 59140, 'https://linea-goerli.drpc.org', 'ETH', 'https://goerli.lineascan.build/'),
+    ('Mumbai', 80001, 'https://polygon-mumbai-bor-rpc.publicnode.com', 'MATIC', 'https://mumbai.polygonscan.com/'),
+    ('opBNB', 204, 'https://opbnb-rpc.publicnode.com', 'BNB', 'https://opbnb.bscscan.com/'),
+    ('opBNB Testnet', 5611, 'https://opbnb-testnet-rpc.publicnode.com', 'BNB', 'https://opbnb-testnet.bscscan.com'),
+    ('Optimism', 10, 'https://optimism-rpc.publicnode.com', 'ETH', 'https://optimistic.etherscan.io'),
+    ('Optimism Sepolia', 11155420, 'https://optimism-sepolia-rpc.publicnode.com', 'ETH', 'https://sepolia-optimism.etherscan.io/'),
+    ('Optimism Goerli', 420, 'https://optimism-testnet.drpc.org', 'ETH', 'https://goerli-optimism.etherscan.io'),
+    ('Polygon', 137, 'https://polygon-bor-rpc.publicnode.com', 'MATIC', 'https://polygonscan.com'),
+    ('Sepolia', 11155111, 'https://ethereum-sepolia-rpc.publicnode.com', 'ETH', 'https://sepolia.etherscan.io'),
+    ('Scroll', 534352, 'https://scroll.drpc.org', 'ETH', 'https://scrollscan.com'),
+    ('zkSync', 324, 'https://zksync.drpc.org', 'ETH', 'https://explorer.zksync.io'),
+)
+
+# Shared, prebuilt NetworkInfo instances. They are handed out by reference, so the entries are read-only as well
+_NETWORK_MAP: Mapping[Network, NetworkInfo] = MappingProxyType({
+    name: cast(NetworkInfo, MappingProxyType(
+        NetworkInfo(network=name, chain_id=chain_id, rpc=rpc, token=token, explorer=explorer)
+    ))
+    for name, chain_id, rpc, token, explorer in _NETWORKS
+})
+_NETWORK_NAMES = frozenset(get_args(Network))
+# Chain id of an RPC endpoint is requested once per _CHAIN_ID_TTL seconds. An endpoint, such as a restarted local node,
+# may serve another chain later, so the chain id isn't cached for the lifetime of the process
+_CHAIN_ID_TTL = 300.0
+_CHAIN_ID_CACHE: dict[str, tuple[int, float]] = {}
+# Symbol and decimals of a token are immutable, so they are requested once per chain and address. Like the other
+# caches of the module, it's bounded and drops the least recently used tokens first
+_TOKEN_CACHE_SIZE = 1024
+_TOKEN_CACHE: OrderedDict[tuple[int, ChecksumAddress], ERC20Token] = OrderedDict()
+_TOKEN_CACHE_LOCK = Lock()
 
 
 class _BaseWallet(ABC):
-    __network_map: ClassVar[dict[Network, NetworkInfo]] = {
-        'Arbitrum Goerli': {
-            'network': 'Arbitrum Goerli',
-            'chain_id': 421613,
-            'rpc': 'https://arbitrum-goerli-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://goerli.arbiscan.io'
-        },
-        'Arbitrum Sepolia': {
-            'network': 'Arbitrum Sepolia',
-            'chain_id': 421614,
-            'rpc': 'https://arbitrum-sepolia-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://sepolia.arbiscan.io'
-        },
-        'Arbitrum': {
-            'network': 'Arbitrum',
-            'chain_id': 42161,
-            'rpc': 'https://arbitrum-one-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://arbiscan.io'
-        },
-        'Avalanche': {
-            'network': 'Avalanche',
-            'chain_id': 43114,
-            'rpc': 'https://avalanche-c-chain-rpc.publicnode.com',
-            'token': 'AVAX',
-            'explorer': 'https://snowtrace.io/'
-        },
-        'Base': {
-            'network': 'Base',
-            'chain_id': 8453,
-            'rpc': 'https://base-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://basescan.org/'
-        },
-        'Base Goerli': {
-            'network': 'Base Goerli',
-            'chain_id': 84531,
-            'rpc': 'https://base-goerli.public.blastapi.io',
-            'token': 'ETH',
-            'explorer': 'https://goerli.basescan.org/'
-        },
-        'Base Sepolia': {
-            'network': 'Base Sepolia',
-            'chain_id': 84532,
-            'rpc': 'https://base-sepolia-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://sepolia.basescan.org/'
-        },
-        'BSC': {
-            'network': 'BSC',
-            'chain_id': 56,
-            'rpc': 'https://bsc-rpc.publicnode.com',
-            'token': 'BNB',
-            'explorer': 'https://bscscan.com'
-        },
-        'BSC Testnet': {
-            'network': 'BSC Testnet',
-            'chain_id': 97,
-            'rpc': 'https://bsc-testnet-rpc.publicnode.com',
-            'token': 'BNB',
-            'explorer': 'https://testnet.bscscan.com'
-        },
-        'Ethereum': {
-            'network': 'Ethereum',
-            'chain_id': 1,
-            'rpc': 'https://ethereum-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://etherscan.io'
-        },
-        'Fantom': {
-            'network': 'Fantom',
-            'chain_id': 250,
-            'rpc': 'https://fantom-rpc.publicnode.com',
-            'token': 'FTM',
-            'explorer': 'https://ftmscan.com/'
-        },
-        'Fantom Testnet': {
-            'network': 'Fantom Testnet',
-            'chain_id': 4002,
-            'rpc': 'https://fantom-testnet-rpc.publicnode.com',
-            'token': 'FTM',
-            'explorer': 'https://testnet.ftmscan.com/'
-        },
-        'Fuji': {
-            'network': 'Fuji',
-            'chain_id': 43113,
-            'rpc': 'https://avalanche-fuji-c-chain-rpc.publicnode.com',
-            'token': 'AVAX',
-            'explorer': 'https://testnet.snowtrace.io'
-        },
-        'Goerli': {
-            'network': 'Goerli',
-            'chain_id': 5,
-            'rpc': 'https://goerli.gateway.tenderly.co',
-            'token': 'ETH',
-            'explorer': 'https://goerli.etherscan.io'
-        },
-        'Linea': {
-            'network': 'Linea',
-            'chain_id': 59144,
-            'rpc': 'https://linea.drpc.org',
-            'token': 'ETH',
-            'explorer': 'https://lineascan.build/'
-        },
-        'Linea Goerli': {
-            'network': 'Linea Goerli',
-            'chain_id': 59140,
-            'rpc': 'https://linea-goerli.drpc.org',
-            'token': 'ETH',
-            'explorer': 'https://goerli.lineascan.build/'
-        },
-        'Mumbai': {
-            'network': 'Mumbai',
-            'chain_id': 80001,
-            'rpc': 'https://polygon-mumbai-bor-rpc.publicnode.com',
-            'token': 'MATIC',
-            'explorer': 'https://mumbai.polygonscan.com/'
-        },
-        'opBNB': {
-            'network': 'opBNB',
-            'chaind_id': 204,
-            'rpc': 'https://opbnb-rpc.publicnode.com',
-            'token': 'BNB',
-            'explorer': 'https://opbnb.bscscan.com/'
-        },
-        'opBNB Testnet': {
-            'network': 'opBNB Testnet',
-            'chaind_id': 5611,
-            'rpc': 'https://opbnb-testnet-rpc.publicnode.com',
-            'token': 'BNB',
-            'explorer': 'https://opbnb-testnet.bscscan.com'
-        },
-        'Optimism': {
-            'network': 'Optimism',
-            'chain_id': 10,
-            'rpc': 'https://optimism-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://optimistic.etherscan.io'
-        },
-        'Optimism Sepolia': {
-            'network': 'Optimism Sepolia',
-            'chaind_id': 11155420,
-            'rpc': 'https://optimism-sepolia-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://sepolia-optimism.etherscan.io/'
-        },
-        'Optimism Goerli': {
-            'network': 'Optimism Goerli',
-            'chain_id': 420,
-            'rpc': 'https://optimism-testnet.drpc.org',
-            'token': 'ETH',
-            'explorer': 'https://goerli-optimism.etherscan.io'
-        },
-        'Polygon': {
-            'network': 'Polygon',
-            'chain_id': 137,
-            'rpc': 'https://polygon-bor-rpc.publicnode.com',
-            'token': 'MATIC',
-            'explorer': 'https://polygonscan.com'
-        },
-        'Sepolia': {
-            'network': 'Sepolia',
-            'chain_id': 11155111,
-            'rpc': 'https://ethereum-sepolia-rpc.publicnode.com',
-            'token': 'ETH',
-            'explorer': 'https://sepolia.etherscan.io'
-        },
-        'Scroll': {
-            'network': 'Scroll',
-            'chaind_id': 534352,
-            'rpc': 'https://scroll.drpc.org',
-            'token': 'ETH',
-            'explorer': 'https://scrollscan.com'
-        },
-        'zkSync': {
-            'network': 'zkSync',
-            'chain_id': 324,
-            'rpc': 'https://zksync.drpc.org',
-            'token': 'ETH',
-            'explorer': 'https://explorer.zksync.io'
-        }
-    }
+    __slots__ = (
+        '_provider', '_network', '_nonce', '__weakref__',
+        '__is_async', '__private_key', '__account', '__public_key', '__native_aliases', '__tx_prefix'
+    )
 
     def __init__(
             self,
@@ -208,25 +178,11 @@ class _BaseWallet(ABC):
             network: Network | NetworkInfo,
             is_async: bool = False
     ):
-        network_info = self.__validate_network(network)
-        rpc = network_info['rpc']
-
-        temp_provider = Web3(Web3.HTTPProvider(rpc))
-
-        if is_async:
-            self._provider = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc))
-        else:
-            self._provider = temp_provider
-
-        self.__validate_chain_id(network_info, temp_provider)
-
         self.__is_async = is_async
         self.__private_key = private_key
-        self.__account = Account.from_key(private_key)
-        self.__public_key = self._provider.to_checksum_address(self.__account.address)
-        self._nonce = temp_provider.eth.get_transaction_count(self.__public_key)
+        self.__account, self.__public_key = _account_from_key(private_key)
 
-        self._network = network_info
+        self.__connect(network)
 
     @classmethod
     def create(cls, network: Network | NetworkInfo = 'Ethereum') -> Self:
@@ -263,21 +219,7 @@ class _BaseWallet(ABC):
                       type NetworkInfo
         :return: None
         """
-        is_async = self.__is_async
-
-        network_info = self.__validate_network(value)
-        rpc = network_info['rpc']
-        self._network = network_info
-
-        temp_provider = Web3(Web3.HTTPProvider(rpc))
-        self.__validate_chain_id(network_info, temp_provider)
-
-        if is_async:
-            self._provider = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc))
-        else:
-            self._provider = temp_provider
-
-        self._nonce = temp_provider.eth.get_transaction_count(self.__public_key)
+        self.__connect(value)
 
     @property
     def private_key(self) -> str:
@@ -296,10 +238,11 @@ class _BaseWallet(ABC):
         return self.__public_key
 
     @property
-    def nonce(self) -> int:
+    def nonce(self) -> Optional[int]:
         """
-        Nonce of the current wallet.
-        :return: Nonce of the current wallet
+        Nonce of the current wallet, known to it. It's None until the nonce is requested from the network after
+        connecting to the network or after a failed transaction
+        :return: Nonce of the current wallet or None
         """
         return self._nonce
 
@@ -308,38 +251,36 @@ class _BaseWallet(ABC):
         return self.network['token']
 
     @classmethod
-    def get_network_map(cls) -> dict[Network, NetworkInfo]:
-        return cls.__network_map
+    def get_network_map(cls) -> Mapping[Network, NetworkInfo]:
+        """
+        Information about supported networks. The map and its entries are read-only views shared by all wallets, so
+        copy an entry with dict() before changing it
+        :return: Read-only mapping of network names to information about them represented as type NetworkInfo
+        """
+        return _NETWORK_MAP
 
     def is_native_token(self, token: str | AnyAddress | ERC20Token) -> bool:
         """
         Returns true if token is native token of network
 
-        :param token: Symbol of token or zero-address - 0x0000000000000000000000000000000000000000
+        :param token: Symbol of token in any case or zero-address - 0x0000000000000000000000000000000000000000 as a
+                      string or raw bytes
         :return: True if token is native token of network
         """
-        network = self.network
-
-        if isinstance(token, ERC20Token):
-            return False
+        if isinstance(token, str):
+            native_aliases = self.__native_aliases
+            return token in native_aliases or token.lower() in native_aliases
 
-        native_token = network['token']
-
-        if isinstance(token, bytes):
-            token.hex()
-
-        return (token.upper() == native_token or
-                token.lower() == native_token or
-                token == ZERO_ADDRESS)
+        # Raw bytes can only be an address, and ERC20Token never equals bytes
+        return token == _ZERO_ADDRESS_BYTES
 
     @classmethod
     def __validate_network(
             cls,
             network: Network | NetworkInfo
     ) -> NetworkInfo:
-        if _in_literal(network, Network):
-            network = cast(Network, network)
-            network_info = NetworkInfo(**cls.__network_map[network])
+        if isinstance(network, str) and network in _NETWORK_NAMES:
+            network_info = _NETWORK_MAP[cast(Network, network)]
         elif _is_network_info(network):
             network_info = cast(NetworkInfo, network)
         else:
@@ -348,48 +289,112 @@ class _BaseWallet(ABC):
 
         return network_info
 
+    def __connect(self, network: Network | NetworkInfo) -> None:
+        network_info = self.__validate_network(network)
+        rpc = network_info['rpc']
+
+        provider = _create_provider(rpc, self.__is_async)
+        chain_id = self.__fetch_chain_id(provider, rpc)
+        self.__validate_chain_id(network_info, chain_id)
+        # Entries of the network map are shared, so the wallet keeps its own copy, which is safe to change
+        self._network = NetworkInfo(network_info, chain_id=chain_id)
+        self._provider = provider
+
+        self._nonce = None
+        native_token = network_info['token']
+        self.__native_aliases = frozenset({ZERO_ADDRESS, native_token, native_token.lower()})
+
+        explorer = network_info.get('explorer')
+        self.__tx_prefix = f"{explorer.rstrip('/')}/tx/" if explorer else None
+
+    @staticmethod
+    def __fetch_chain_id(provider: AsyncWeb3 | Web3, rpc: str) -> int:
+        now = monotonic()
+        chain_id, expires_at = _CHAIN_ID_CACHE.get(rpc, (None, now))
+
+        if expires_at <= now:
+            # Connecting is synchronous, so an async wallet requests the chain id through a temporary sync provider
+            sync_provider = provider if isinstance(provider, Web3) else Web3(Web3.HTTPProvider(rpc))
+            chain_id = sync_provider.eth.chain_id
+            _CHAIN_ID_CACHE[rpc] = (chain_id, now + _CHAIN_ID_TTL)
+
+        return chain_id
+
     @classmethod
-    def __validate_chain_id(cls, network_info: NetworkInfo, provider: Web3) -> NetworkInfo:
-        chain_id = provider.eth.chain_id
-        if network_info.get('chain_id') is not None and chain_id != network_info['chain_id']:
+    def __validate_chain_id(cls, network_info: NetworkInfo, chain_id: int) -> None:
+        expected_chain_id = network_info.get('chain_id')
+
+        if expected_chain_id is not None and chain_id != expected_chain_id:
             raise ValueError(f'Chain id in network info must be equal to the chain. Try to find it by: '
                              f'https://chainlist.org/?search={network_info["network"].lower()}')
-        else:
-            network_info['chain_id'] = chain_id
-
-        return network_info
 
-    @staticmethod
-    @lru_cache()
-    def _get_erc20_abi() -> ABI:
-        abs_path = os.path.dirname(os.path.abspath(__file__))
-        path = f"{abs_path}/erc20.abi"
-        with open(path) as file:
-            return json.load(file)
-
-    @lru_cache(maxsize=6)
     def _load_token_contract(self, address: AnyAddress) -> AsyncContract | Contract:
-        if isinstance(address, bytes):
-            address = address.hex()
+        return _load_erc20_contract(self.provider, _checksum(address))
+
+    def _sign_transaction(self, tx_params: TxParams) -> SignedTransaction:
+        return self.__account.sign_transaction(tx_params)
+
+    def _load_multicall_contract(self) -> AsyncContract | Contract:
+        return _load_multicall_contract(self.provider)
+
+    def _build_balance_calls(self, tokens: Sequence[ERC20Token]) -> list[tuple[ChecksumAddress, bool, HexStr]]:
+        return [
+            (token.address, False, self._load_token_contract(token.address).encodeABI(
+                fn_name='balanceOf', args=[self.public_key]
+            ))
+            for token in tokens
+        ]
+
+    def _parse_balances(
+            self,
+            tokens: Sequence[ERC20Token],
+            results: list[tuple[bool, bytes]],
+            convert: bool
+    ) -> dict[ERC20Token, float]:
+        codec = self.provider.codec
+        balances = {}
 
-        provider = self.provider
-        address = provider.to_checksum_address(address)
-        abi = self._get_erc20_abi()
-        contract = provider.eth.contract(address=address, abi=abi)
-        return contract
+        for token, (_, return_data) in zip(tokens, results):
+            balance, = codec.decode(['uint256'], return_data)
+            balances[token] = balance / 10 ** token.decimals if convert else balance
+
+        return balances
+
+    def _get_cached_token(self, address: ChecksumAddress) -> Optional[ERC20Token]:
+        key = (self._network['chain_id'], address)
+
+        with _TOKEN_CACHE_LOCK:
+            token = _TOKEN_CACHE.get(key)
+
+            if token is not None:
+                _TOKEN_CACHE.move_to_end(key)
+
+        return token
+
+    def _cache_token(self, token: ERC20Token) -> ERC20Token:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[(self._network['chain_id'], token.address)] = token
+
+            if len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+                _TOKEN_CACHE.popitem(last=False)
+
+        return token
 
     def get_explorer_url(self, tx_hash: HexBytes | str) -> str:
         """
         Returns the explorer url for the given transaction hash
         :return: Explorer url for the given transaction
         """
-        if isinstance(tx_hash, bytes):
-            tx_hash = tx_hash.hex()
-        elif not isinstance(tx_hash, str):
-            raise TypeError(f"Invalid transaction hash type: {type(tx_hash)}")
+        if not isinstance(tx_hash, str):
+            tx_hash = _as_str(tx_hash)
+
+            if not isinstance(tx_hash, str):
+                raise TypeError(f"Invalid transaction hash type: {type(tx_hash)}")
+
+        if self.__tx_prefix is None:
+            raise ValueError(f"Explorer is not specified for the network {self.network['network']}")
 
-        explorer_url = f'{self.network["explorer"]}/tx/{tx_hash}'
-        return explorer_url
+        return self.__tx_prefix + tx_hash
 
     @abstractmethod
     def get_token(self, address: AnyAddress) -> ERC20Token:
@@ -451,3 +456,7 @@ class _BaseWallet(ABC):
     @abstractmethod
     def get_balance_of(self, token: ERC20Token, convert: bool = False) -> float:
         pass
+
+    @abstractmethod
+    def get_balances_of(self, tokens: Sequence[ERC20Token], convert: bool = False) -> dict[ERC20Token, float]:
+        pass
@@ -1,4 +1,5 @@
-from typing import Optional
+from asyncio import Lock, gather, to_thread
+from typing import Optional, Sequence, cast
 from eth_typing import HexStr
 from hexbytes import HexBytes
 from web3 import AsyncWeb3
@@ -6,7 +7,7 @@ from web3.contract.async_contract import AsyncContractFunction, AsyncContract
 from web3.types import TxParams, Wei
 from evm_wallet._base_wallet import _BaseWallet
 from evm_wallet.types import Network, NetworkInfo, TokenAmount, AnyAddress, ERC20Token
-from evm_wallet.utils import is_checksum_address
+from evm_wallet.utils import is_checksum_address, _checksum, _is_nonce_error
 
 
 class AsyncWallet(_BaseWallet):
@@ -15,6 +16,8 @@ class AsyncWallet(_BaseWallet):
     You can change a network of the wallet at any time using network setter
     """
 
+    __slots__ = ('_nonce_lock',)
+
     def __init__(
             self,
             private_key: str,
@@ -26,6 +29,7 @@ class AsyncWallet(_BaseWallet):
         type NetworkInfo
         """
         super().__init__(private_key, network, True)
+        self._nonce_lock = Lock()
 
     @property
     def provider(self) -> AsyncWeb3:
@@ -34,6 +38,17 @@ class AsyncWallet(_BaseWallet):
     def _load_token_contract(self, address: AnyAddress) -> AsyncContract:
         return super()._load_token_contract(address)
 
+    async def get_nonce(self) -> int:
+        """
+        Returns nonce of the current wallet. It's requested from the network on first call after connecting to the
+        network, unlike nonce property, which never requests the network to keep the event loop free
+        :return: Nonce of the current wallet
+        """
+        if self._nonce is None:
+            self._nonce = await self.provider.eth.get_transaction_count(self.public_key, 'pending')
+
+        return self._nonce
+
     async def get_balance(self, from_wei: bool = False) -> float | Wei:
         """
         Returns the balance of the current account in ethereum or wei units.
@@ -85,14 +100,27 @@ class AsyncWallet(_BaseWallet):
         :return: Transaction's hash
         """
         gas_ = Wei(300_000) if not gas else gas
-        tx_params = await self.build_tx_params(value=value, gas=gas_, gas_price=gas_price)
+        # Gas price is requested concurrently with the estimation instead of beforehand. The placeholder price is
+        # left out of the estimation, since nodes reject a price below the base fee
+        fetch_gas_price = not gas and not gas_price
+        tx_params = await self.build_tx_params(
+            value=value,
+            gas=gas_,
+            gas_price=Wei(1) if fetch_gas_price else gas_price
+        )
         tx_params = await closure.build_transaction(tx_params)
 
-        if not gas:
+        if fetch_gas_price:
+            estimate_params = cast(TxParams, {key: param for key, param in tx_params.items() if key != 'gasPrice'})
+            tx_params['gas'], tx_params['gasPrice'] = await gather(
+                self.estimate_gas(estimate_params),
+                self.provider.eth.gas_price
+            )
+        elif not gas:
             gas = await self.estimate_gas(tx_params)
             tx_params['gas'] = gas
 
-        return await self.transact(tx_params)
+        return await self._transact(tx_params, allocate_nonce=True)
 
     async def approve(
             self,
@@ -111,7 +139,7 @@ class AsyncWallet(_BaseWallet):
             raise ValueError('Invalid contract address is provided')
 
         token = self._load_token_contract(token.address)
-        contract_address = self.provider.to_checksum_address(contract_address)
+        contract_address = _checksum(contract_address)
         return await self.build_and_transact(
             token.functions.approve(contract_address, token_amount)
         )
@@ -138,14 +166,14 @@ class AsyncWallet(_BaseWallet):
         tx_params = {
             'from': self.public_key,
             'chainId': self.network['chain_id'],
-            'nonce': self.nonce,
+            'nonce': await self.get_nonce(),
             'value': value,
             'gas': gas,
             'gasPrice': gas_price if gas_price else await provider.eth.gas_price,
         }
 
         if recipient:
-            tx_params['to'] = self.provider.to_checksum_address(recipient)
+            tx_params['to'] = _checksum(recipient)
 
         if raw_data:
             tx_params['data'] = raw_data
@@ -154,17 +182,47 @@ class AsyncWallet(_BaseWallet):
 
     async def transact(self, tx_params: TxParams) -> HexBytes:
         """
-        Performs transaction, using transaction params, which are got after building
+        Performs transaction, using transaction params, which are got after building. If the node rejects the nonce
+        allocated by the wallet, it's synchronized with the pending transaction count and the transaction is sent once
+        again. A transaction with any other nonce is never sent again
         :param tx_params: Built transaction's params
         :return: Transaction's hash
         """
-        provider = self.provider
-        signed_transaction = provider.eth.account.sign_transaction(tx_params, self.private_key)
-        tx_hash = await provider.eth.send_raw_transaction(signed_transaction.rawTransaction)
-        self._nonce += 1
+        return await self._transact(tx_params, allocate_nonce=False)
+
+    async def _transact(self, tx_params: TxParams, allocate_nonce: bool) -> HexBytes:
+        async with self._nonce_lock:
+            if allocate_nonce:
+                tx_params['nonce'] = await self.get_nonce()
+
+            # A rejected nonce, which isn't the wallet's own, may belong to a replacement or to an already mined
+            # transaction, so sending again would broadcast one more transaction
+            is_own_nonce = tx_params['nonce'] == await self.get_nonce()
+
+            try:
+                tx_hash = await self._send_transaction(tx_params)
+            except ValueError as error:
+                if not is_own_nonce or not _is_nonce_error(error):
+                    raise
+
+                tx_params['nonce'] = await self.get_nonce()
+                tx_hash = await self._send_transaction(tx_params)
+
+            self._nonce = tx_params['nonce'] + 1
 
         return tx_hash
 
+    async def _send_transaction(self, tx_params: TxParams) -> HexBytes:
+        # Signing is CPU-bound, so it runs in a worker thread to keep the event loop free
+        signed_transaction = await to_thread(self._sign_transaction, tx_params)
+
+        try:
+            return await self.provider.eth.send_raw_transaction(signed_transaction.rawTransaction)
+        except Exception:
+            # The transaction may have been accepted despite the error, so the nonce is requested from the network again
+            self._nonce = None
+            raise
+
     async def transfer(
             self,
             token: ERC20Token,
@@ -186,7 +244,7 @@ class AsyncWallet(_BaseWallet):
             raise ValueError('Invalid recipient address is provided')
 
         token_contract = self._load_token_contract(token.address)
-        recipient = self.provider.to_checksum_address(recipient)
+        recipient = _checksum(recipient)
         closure = token_contract.functions.transfer(recipient, token_amount)
         return await self.build_and_transact(closure, Wei(0), gas, gas_price)
 
@@ -205,6 +263,21 @@ class AsyncWallet(_BaseWallet):
 
         return balance
 
+    async def get_balances_of(self, tokens: Sequence[ERC20Token], convert: bool = False) -> dict[ERC20Token, float]:
+        """
+        Returns balances of several tokens in ethereum or wei units, requested by a single call to Multicall3 contract.
+        Notice that Multicall3 has to be deployed on the network at MULTICALL3_ADDRESS
+        :param tokens: ERC20Token instances
+        :param convert: Whether to divide token balances by their decimals (default: False)
+        :return: Dictionary of specified tokens and their balances in ethereum or wei units
+        """
+        if not tokens:
+            return {}
+
+        multicall = self._load_multicall_contract()
+        results = await multicall.functions.aggregate3(self._build_balance_calls(tokens)).call()
+        return self._parse_balances(tokens, results, convert)
+
     async def get_token(self, address: AnyAddress) -> ERC20Token:
         """
         Returns ERC20 token, containing information about it
@@ -214,9 +287,16 @@ class AsyncWallet(_BaseWallet):
         if not is_checksum_address(address):
             raise ValueError('Invalid token address is provided')
 
-        address = self._provider.to_checksum_address(address)
+        address = _checksum(address)
+        token = self._get_cached_token(address)
+
+        if token is not None:
+            return token
+
         token_contract = self._load_token_contract(address)
-        symbol = await token_contract.functions.symbol().call()
-        decimals = await token_contract.functions.decimals().call()
+        symbol, decimals = await gather(
+            token_contract.functions.symbol().call(),
+            token_contract.functions.decimals().call()
+        )
 
-        return ERC20Token(address=address, symbol=symbol, decimals=decimals)
+        return self._cache_token(ERC20Token(address=address, symbol=symbol, decimals=decimals))
@@ -1,9 +1,11 @@
-from web3.types import Wei
 from dataclasses import dataclass
 from eth_typing import Address, HexAddress,  ChecksumAddress
-from typing import Union, Literal, TypedDict, NotRequired
+from typing import Union, Literal, TypedDict, NotRequired, TYPE_CHECKING
 
-TokenAmount = Union[Wei, int]
+if TYPE_CHECKING:
+    from web3.types import Wei
+
+TokenAmount = Union['Wei', int]
 AnyAddress = Union[Address, HexAddress, ChecksumAddress, bytes, str]
 Network = Literal['Arbitrum Goerli', 'Arbitrum Sepolia', 'Arbitrum', 'Avalanche', 'Base', 'Base Sepolia', 'Base Goerli',
                   'BSC', 'BSC Testnet', 'Ethereum', 'Fantom', 'Fantom Testnet', 'Fuji', 'Goerli', 'Linea', 'Linea Goerli',
@@ -1,37 +1,45 @@
-from typing import Literal, get_args, TypedDict, Type, Any, cast
+from functools import lru_cache
+from typing import Any, Mapping, cast
+from eth_typing import ChecksumAddress
 from eth_utils import is_text, is_hex_address, to_checksum_address
-from evm_wallet.types import NetworkInfo
+from evm_wallet.types import NetworkInfo, AnyAddress
 
+_NETWORK_INFO_KEYS = frozenset(NetworkInfo.__annotations__)
+_NETWORK_INFO_REQUIRED_KEYS = NetworkInfo.__required_keys__
 
-def _in_literal(value: Any, expected_type: Literal) -> bool:
-    values = get_args(expected_type)
-    return value in values
 
+def _is_network_info(value: Any) -> bool:
+    if not isinstance(value, Mapping):
+        return False
 
-def _has_keys(value: Any, typed_dict: Type[TypedDict]) -> bool:
-    typed_dict_keys = typed_dict.__annotations__.keys()
+    keys = value.keys()
+    return _NETWORK_INFO_REQUIRED_KEYS <= keys and keys <= _NETWORK_INFO_KEYS
 
-    try:
-        value_keys = value.keys()
-    except AttributeError:
-        return False
 
-    return typed_dict_keys == value_keys
+def _as_str(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f'0x{bytes(value).hex()}'
+    return value
 
 
-def _is_network_info(value: Any) -> bool:
-    if _has_keys(value, NetworkInfo):
-        return True
-    else:
-        try:
-            value_keys = value.keys()
-        except AttributeError:
-            return False
+@lru_cache(maxsize=4096)
+def _checksum_normalized(address: str) -> ChecksumAddress:
+    return to_checksum_address(address)
+
+
+def _checksum(address: AnyAddress) -> ChecksumAddress:
+    """
+    Memoized version of to_checksum_address. Lowercase, checksum and bytes forms of an address share one cache entry
+    """
+    address = _as_str(address).lower()
+    if not address.startswith('0x'):
+        address = f'0x{address}'
+
+    return _checksum_normalized(address)
 
-        if set(value_keys) == {'network', 'rpc', 'token'}:
-            return True
 
-    return False
+def _is_nonce_error(error: Exception) -> bool:
+    return 'nonce' in str(error).lower()
 
 
 def is_checksum_address(value: Any) -> bool:
@@ -41,5 +49,5 @@ def is_checksum_address(value: Any) -> bool:
     if not is_hex_address(value):
         return False
 
-    is_equal = value.lower() == to_checksum_address(value).lower()
+    is_equal = value.lower() == _checksum(value).lower()
     return cast(bool, is_equal)
@@ -1,4 +1,5 @@
-from typing import Optional
+from threading import Lock
+from typing import Optional, Sequence
 from eth_typing import HexStr
 from hexbytes import HexBytes
 from web3 import Web3
@@ -6,7 +7,7 @@ from web3.contract.contract import ContractFunction, Contract
 from web3.types import TxParams, Wei
 from evm_wallet._base_wallet import _BaseWallet
 from evm_wallet.types import Network, NetworkInfo, TokenAmount, AnyAddress, ERC20Token
-from evm_wallet.utils import is_checksum_address
+from evm_wallet.utils import is_checksum_address, _checksum, _is_nonce_error
 
 
 class Wallet(_BaseWallet):
@@ -15,6 +16,8 @@ class Wallet(_BaseWallet):
     You can change a network of the wallet at any time using network setter
     """
 
+    __slots__ = ('_nonce_lock',)
+
     def __init__(
             self,
             private_key: str,
@@ -26,11 +29,23 @@ class Wallet(_BaseWallet):
         type NetworkInfo
         """
         super().__init__(private_key, network, False)
+        self._nonce_lock = Lock()
 
     @property
     def provider(self) -> Web3:
         return self._provider
 
+    @property
+    def nonce(self) -> int:
+        """
+        Nonce of the current wallet. It's requested from the network on first access after connecting to the network
+        :return: Nonce of the current wallet
+        """
+        if self._nonce is None:
+            self._nonce = self.provider.eth.get_transaction_count(self.public_key, 'pending')
+
+        return self._nonce
+
     def _load_token_contract(self, address: AnyAddress) -> Contract:
         return super()._load_token_contract(address)
 
@@ -92,7 +107,7 @@ class Wallet(_BaseWallet):
             gas = self.estimate_gas(tx_params)
             tx_params['gas'] = gas
 
-        return self.transact(tx_params)
+        return self._transact(tx_params, allocate_nonce=True)
 
     def approve(
             self,
@@ -111,7 +126,7 @@ class Wallet(_BaseWallet):
             raise ValueError('Invalid contract address is provided')
 
         token = self._load_token_contract(token.address)
-        contract_address = self.provider.to_checksum_address(contract_address)
+        contract_address = _checksum(contract_address)
         return self.build_and_transact(
             token.functions.approve(contract_address, token_amount)
         )
@@ -145,7 +160,7 @@ class Wallet(_BaseWallet):
         }
 
         if recipient:
-            tx_params['to'] = provider.to_checksum_address(recipient)
+            tx_params['to'] = _checksum(recipient)
 
         if raw_data:
             tx_params['data'] = raw_data
@@ -154,17 +169,46 @@ class Wallet(_BaseWallet):
 
     def transact(self, tx_params: TxParams) -> HexBytes:
         """
-        Performs transaction, using transaction params, which are got after building
+        Performs transaction, using transaction params, which are got after building. If the node rejects the nonce
+        allocated by the wallet, it's synchronized with the pending transaction count and the transaction is sent once
+        again. A transaction with any other nonce is never sent again
         :param tx_params: Built transaction's params
         :return: Transaction hash
         """
-        provider = self.provider
-        signed_transaction = provider.eth.account.sign_transaction(tx_params, self.private_key)
-        tx_hash = provider.eth.send_raw_transaction(signed_transaction.rawTransaction)
-        self._nonce += 1
+        return self._transact(tx_params, allocate_nonce=False)
+
+    def _transact(self, tx_params: TxParams, allocate_nonce: bool) -> HexBytes:
+        with self._nonce_lock:
+            if allocate_nonce:
+                tx_params['nonce'] = self.nonce
+
+            # A rejected nonce, which isn't the wallet's own, may belong to a replacement or to an already mined
+            # transaction, so sending again would broadcast one more transaction
+            is_own_nonce = tx_params['nonce'] == self.nonce
+
+            try:
+                tx_hash = self._send_transaction(tx_params)
+            except ValueError as error:
+                if not is_own_nonce or not _is_nonce_error(error):
+                    raise
+
+                tx_params['nonce'] = self.nonce
+                tx_hash = self._send_transaction(tx_params)
+
+            self._nonce = tx_params['nonce'] + 1
 
         return tx_hash
 
+    def _send_transaction(self, tx_params: TxParams) -> HexBytes:
+        signed_transaction = self._sign_transaction(tx_params)
+
+        try:
+            return self.provider.eth.send_raw_transaction(signed_transaction.rawTransaction)
+        except Exception:
+            # The transaction may have been accepted despite the error, so the nonce is requested from the network again
+            self._nonce = None
+            raise
+
     def transfer(
             self,
             token: ERC20Token,
@@ -186,7 +230,7 @@ class Wallet(_BaseWallet):
             raise ValueError('Invalid recipient address is provided')
 
         token_contract = self._load_token_contract(token.address)
-        recipient = self.provider.to_checksum_address(recipient)
+        recipient = _checksum(recipient)
         closure = token_contract.functions.transfer(recipient, token_amount)
         return self.build_and_transact(closure, Wei(0), gas, gas_price)
 
@@ -205,6 +249,21 @@ class Wallet(_BaseWallet):
 
         return balance
 
+    def get_balances_of(self, tokens: Sequence[ERC20Token], convert: bool = False) -> dict[ERC20Token, float]:
+        """
+        Returns balances of several tokens in ethereum or wei units, requested by a single call to Multicall3 contract.
+        Notice that Multicall3 has to be deployed on the network at MULTICALL3_ADDRESS
+        :param tokens: ERC20Token instances
+        :param convert: Whether to divide token balances by their decimals (default: False)
+        :return: Dictionary of specified tokens and their balances in ethereum or wei units
+        """
+        if not tokens:
+            return {}
+
+        multicall = self._load_multicall_contract()
+        results = multicall.functions.aggregate3(self._build_balance_calls(tokens)).call()
+        return self._parse_balances(tokens, results, convert)
+
     def get_token(self, address: AnyAddress) -> ERC20Token:
         """
         Returns ERC20 token, containing information about it
@@ -214,9 +273,14 @@ class Wallet(_BaseWallet):
         if not is_checksum_address(address):
             raise ValueError('Invalid token address is provided')
 
-        address = self._provider.to_checksum_address(address)
+        address = _checksum(address)
+        token = self._get_cached_token(address)
+
+        if token is not None:
+            return token
+
         token_contract = self._load_token_contract(address)
         symbol = token_contract.functions.symbol().call()
         decimals = token_contract.functions.decimals().call()
 
-        return ERC20Token(address=address, symbol=symbol, decimals=decimals)
+        return self._cache_token(ERC20Token(address=address, symbol=symbol, decimals=decimals))
@@ -1,5 +1,12 @@
 import pytest
+from asyncio import Barrier, gather
+from math import inf
+from types import SimpleNamespace
 from dotenv import dotenv_values
+from web3.types import TxParams, Wei
+from evm_wallet import AsyncWallet, NetworkInfo
+from evm_wallet._base_wallet import _CHAIN_ID_CACHE, _create_provider
+from tests.utils import FakeNode
 
 dotenv_values = dotenv_values()
 
@@ -9,6 +16,13 @@ def wallet(make_wallet):
     return make_wallet(network='BSC', is_async=True, private_key=dotenv_values.get('TEST_PRIVATE_KEY'))
 
 
+@pytest.fixture
+def offline_wallet(monkeypatch):
+    network = NetworkInfo(network='Offline', rpc='http://127.0.0.1:1', token='ETH', chain_id=1)
+    monkeypatch.setitem(_CHAIN_ID_CACHE, network['rpc'], (network['chain_id'], inf))
+    return AsyncWallet('0x' + '11' * 32, network)
+
+
 @pytest.mark.asyncio
 async def test_get_balance(wallet):
     balance = await wallet.get_balance()
@@ -26,6 +40,12 @@ async def test_get_balance_of(wallet, usdc):
     assert isinstance(await wallet.get_balance_of(usdc), int)
 
 
+@pytest.mark.asyncio
+async def test_get_balances_of(wallet, usdc):
+    balances = await wallet.get_balances_of([usdc])
+    assert list(balances) == [usdc] and isinstance(balances[usdc], int)
+
+
 @pytest.mark.asyncio
 async def test_transaction(wallet, eth_amount):
     recipient = '0xe977Fa8D8AE7D3D6e28c17A868EF04bD301c583f'
@@ -37,3 +57,114 @@ async def test_transaction(wallet, eth_amount):
 async def test_transfer(wallet, eth_amount, usdc):
     recipient = '0xe977Fa8D8AE7D3D6e28c17A868EF04bD301c583f'
     return await wallet.transfer(usdc, recipient, 10 ** (usdc.decimals - 2))
+
+
+@pytest.mark.asyncio
+async def test_get_nonce(offline_wallet, monkeypatch):
+    async def get_transaction_count(address, block_identifier) -> int:
+        return 5
+
+    monkeypatch.setattr(offline_wallet.provider.eth, 'get_transaction_count', get_transaction_count)
+
+    assert offline_wallet.nonce is None
+    assert await offline_wallet.get_nonce() == 5
+    assert offline_wallet.nonce == 5
+
+
+@pytest.mark.asyncio
+async def test_chain_id_cache(monkeypatch):
+    requests = []
+
+    async def make_request(method, params):
+        requests.append(method)
+
+        if len(requests) == 1:
+            return {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32603, 'message': 'Node is unavailable'}}
+        return {'jsonrpc': '2.0', 'id': len(requests), 'result': '0x38'}
+
+    providers = [_create_provider('http://127.0.0.1:1', True) for _ in range(2)]
+    for provider in providers:
+        monkeypatch.setattr(provider.provider, 'make_request', make_request)
+
+    with pytest.raises(ValueError):
+        await providers[0].eth.chain_id
+
+    for provider in providers:
+        assert await provider.eth.chain_id == 56
+        assert await provider.eth.chain_id == 56
+
+    assert requests == ['eth_chainId'] * 3
+
+
+@pytest.fixture
+def node(offline_wallet, monkeypatch):
+    node = FakeNode(pending_nonce=5)
+
+    async def get_transaction_count(address, block_identifier) -> int:
+        return node.get_transaction_count(address, block_identifier)
+
+    async def send_raw_transaction(nonce: int):
+        return node.send_raw_transaction(nonce)
+
+    eth = offline_wallet.provider.eth
+    monkeypatch.setattr(eth, 'get_transaction_count', get_transaction_count)
+    monkeypatch.setattr(eth, 'send_raw_transaction', send_raw_transaction)
+    # The node receives the nonce instead of the signed transaction
+    monkeypatch.setattr(AsyncWallet, '_sign_transaction', lambda self, tx_params: SimpleNamespace(
+        rawTransaction=tx_params['nonce']
+    ))
+    return node
+
+
+@pytest.mark.asyncio
+async def test_transact_reconciles_own_nonce(offline_wallet, node):
+    await offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    node.pending_nonce = 7
+
+    await offline_wallet.transact(await offline_wallet.build_tx_params(0, gas_price=Wei(1)))
+    assert node.sent_nonces == [7]
+    assert offline_wallet.nonce == 8
+
+
+@pytest.mark.asyncio
+async def test_transact_keeps_nonce_of_caller(offline_wallet, node):
+    tx_params = await offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    tx_params['nonce'] = 4
+
+    with pytest.raises(ValueError):
+        await offline_wallet.transact(tx_params)
+
+    assert node.sent_nonces == []
+
+
+@pytest.mark.asyncio
+async def test_transact_after_lost_response(offline_wallet, node):
+    tx_params = await offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    node.drop_response = True
+
+    with pytest.raises(TimeoutError):
+        await offline_wallet.transact(tx_params)
+
+    assert offline_wallet.nonce is None
+
+    with pytest.raises(ValueError):
+        await offline_wallet.transact(tx_params)
+
+    assert node.sent_nonces == [5]
+    assert offline_wallet.nonce is None
+    assert await offline_wallet.get_nonce() == 6
+
+
+@pytest.mark.asyncio
+async def test_concurrent_build_and_transact(offline_wallet, node):
+    barrier = Barrier(2)
+
+    async def build_transaction(tx_params: TxParams) -> TxParams:
+        # Both transactions are built before any of them is sent
+        await barrier.wait()
+        return tx_params
+
+    closure = SimpleNamespace(build_transaction=build_transaction)
+    await gather(*(offline_wallet.build_and_transact(closure, gas=21_000, gas_price=Wei(1)) for _ in range(2)))
+
+    assert sorted(node.sent_nonces) == [5, 6]
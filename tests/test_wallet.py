@@ -1,4 +1,18 @@
 import pytest
+from collections import OrderedDict
+from math import inf
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from types import SimpleNamespace
+from weakref import ref
+from hexbytes import HexBytes
+from web3.eth import Eth
+from web3.middleware import geth_poa_middleware
+from web3.types import TxParams, Wei
+from evm_wallet import Wallet, NetworkInfo, ERC20Token, ZERO_ADDRESS
+from evm_wallet import _base_wallet
+from evm_wallet._base_wallet import _CHAIN_ID_CACHE
+from tests.utils import FakeNode
 
 
 @pytest.fixture
@@ -9,3 +23,168 @@ def wallet(make_wallet):
 def test_get_balance(wallet):
     balance = wallet.get_balance()
     assert balance
+
+
+def test_network_map():
+    for network, network_info in Wallet.get_network_map().items():
+        assert network_info['network'] == network
+        assert isinstance(network_info.get('chain_id'), int)
+
+
+def test_network_map_is_read_only():
+    network_map = Wallet.get_network_map()
+
+    with pytest.raises(TypeError):
+        network_map['Ethereum'] = network_map['BSC']
+
+    with pytest.raises(TypeError):
+        network_map['BSC']['token'] = 'XYZ'
+
+
+def test_network_is_copied(monkeypatch):
+    network_info = Wallet.get_network_map()['BSC']
+    monkeypatch.setitem(_CHAIN_ID_CACHE, network_info['rpc'], (network_info['chain_id'], inf))
+    wallet = Wallet('0x' + '11' * 32, 'BSC')
+
+    wallet.network['rpc'] = 'http://127.0.0.1:1'
+    assert wallet.network is not network_info
+    assert network_info['rpc'] != wallet.network['rpc']
+
+
+def test_expired_chain_id_is_requested_again(monkeypatch):
+    network = NetworkInfo(network='Offline', rpc='http://127.0.0.1:1', token='ETH', chain_id=1)
+    monkeypatch.setitem(_CHAIN_ID_CACHE, network['rpc'], (56, 0.0))
+    monkeypatch.setattr(Eth, 'chain_id', property(lambda eth: 1))
+
+    Wallet('0x' + '11' * 32, network)
+    assert _CHAIN_ID_CACHE[network['rpc']][0] == 1
+
+
+@pytest.fixture
+def offline_wallet(monkeypatch):
+    network = NetworkInfo(network='Offline', rpc='http://127.0.0.1:1', token='ETH', chain_id=1)
+    monkeypatch.setitem(_CHAIN_ID_CACHE, network['rpc'], (network['chain_id'], inf))
+    return Wallet('0x' + '11' * 32, network)
+
+
+@pytest.fixture
+def node(offline_wallet, monkeypatch):
+    node = FakeNode(pending_nonce=5)
+    eth = offline_wallet.provider.eth
+    monkeypatch.setattr(eth, 'get_transaction_count', node.get_transaction_count)
+    monkeypatch.setattr(eth, 'send_raw_transaction', node.send_raw_transaction)
+    # The node receives the nonce instead of the signed transaction
+    monkeypatch.setattr(Wallet, '_sign_transaction', lambda self, tx_params: SimpleNamespace(
+        rawTransaction=tx_params['nonce']
+    ))
+    return node
+
+
+def test_transact_reconciles_own_nonce(offline_wallet, node):
+    offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    node.pending_nonce = 7
+
+    offline_wallet.transact(offline_wallet.build_tx_params(0, gas_price=Wei(1)))
+    assert node.sent_nonces == [7]
+    assert offline_wallet.nonce == 8
+
+
+def test_transact_keeps_nonce_of_caller(offline_wallet, node):
+    tx_params = offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    tx_params['nonce'] = 4
+
+    with pytest.raises(ValueError):
+        offline_wallet.transact(tx_params)
+
+    assert node.sent_nonces == []
+
+
+def test_transact_after_lost_response(offline_wallet, node):
+    tx_params = offline_wallet.build_tx_params(0, gas_price=Wei(1))
+    node.drop_response = True
+
+    with pytest.raises(TimeoutError):
+        offline_wallet.transact(tx_params)
+
+    with pytest.raises(ValueError):
+        offline_wallet.transact(tx_params)
+
+    assert node.sent_nonces == [5]
+    assert offline_wallet.nonce == 6
+
+
+def test_concurrent_build_and_transact(offline_wallet, node):
+    barrier = Barrier(2)
+
+    def build_transaction(tx_params: TxParams) -> TxParams:
+        # Both transactions are built before any of them is sent
+        barrier.wait()
+        return tx_params
+
+    closure = SimpleNamespace(build_transaction=build_transaction)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda _: offline_wallet.build_and_transact(closure, gas=21_000, gas_price=Wei(1)), range(2)))
+
+    assert sorted(node.sent_nonces) == [5, 6]
+
+
+def test_parse_balances(offline_wallet):
+    usdc = ERC20Token(address='0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d', symbol='USDC', decimals=6)
+    usdt = ERC20Token(address='0x55d398326f99059fF775485246999027B3197955', symbol='USDT', decimals=18)
+    codec = offline_wallet.provider.codec
+    results = [(True, codec.encode(['uint256'], [1_500_000])), (True, codec.encode(['uint256'], [10 ** 18]))]
+
+    assert offline_wallet._parse_balances([usdc, usdt], results, convert=True) == {usdc: 1.5, usdt: 1.0}
+    assert offline_wallet._parse_balances([usdc, usdt], results, convert=False) == {usdc: 1_500_000, usdt: 10 ** 18}
+
+
+def test_wallets_have_own_providers(offline_wallet):
+    other_wallet = Wallet(offline_wallet.private_key, offline_wallet.network)
+
+    for wallet in (offline_wallet, other_wallet):
+        wallet.provider.middleware_onion.inject(geth_poa_middleware, layer=0)
+
+    assert offline_wallet.provider is not other_wallet.provider
+
+
+@pytest.mark.parametrize('token', ['ETH', 'eth', 'Eth', ZERO_ADDRESS, bytes(20), HexBytes(bytes(20))])
+def test_is_native_token(offline_wallet, token):
+    assert offline_wallet.is_native_token(token)
+
+
+@pytest.mark.parametrize('token', [
+    'BNB',
+    ZERO_ADDRESS.removeprefix('0x'),
+    '0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d',
+    HexBytes('0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d'),
+    ERC20Token(address=ZERO_ADDRESS, symbol='ETH', decimals=18)
+])
+def test_is_not_native_token(offline_wallet, token):
+    assert not offline_wallet.is_native_token(token)
+
+
+def test_wallet_supports_weak_references(offline_wallet):
+    assert ref(offline_wallet)() is offline_wallet
+
+
+def test_token_cache_is_bounded(offline_wallet, monkeypatch):
+    monkeypatch.setattr(_base_wallet, '_TOKEN_CACHE', OrderedDict())
+    monkeypatch.setattr(_base_wallet, '_TOKEN_CACHE_SIZE', 2)
+    usdc, usdt, dai = (
+        ERC20Token(address=address, symbol=symbol, decimals=18)
+        for address, symbol in (
+            ('0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d', 'USDC'),
+            ('0x55d398326f99059fF775485246999027B3197955', 'USDT'),
+            ('0x1AF3F329e8BE154074D8769D1FFa4eE058B1DBc3', 'DAI')
+        )
+    )
+
+    offline_wallet._cache_token(usdc)
+    offline_wallet._cache_token(usdt)
+    assert offline_wallet._get_cached_token(usdc.address) == usdc
+
+    offline_wallet._cache_token(dai)
+    assert offline_wallet._get_cached_token(usdt.address) is None
+    assert offline_wallet._get_cached_token(usdc.address) == usdc
+    assert offline_wallet._get_cached_token(dai.address) == dai
@@ -1,4 +1,5 @@
 from functools import wraps
+from hexbytes import HexBytes
 
 
 def validate_status(func):
@@ -11,3 +12,29 @@ def validate_status(func):
         assert status
 
     return wrapper
+
+
+class FakeNode:
+    def __init__(self, pending_nonce: int):
+        self.pending_nonce = pending_nonce
+        self.sent_nonces = []
+        self.drop_response = False
+
+    def get_transaction_count(self, address, block_identifier) -> int:
+        return self.pending_nonce
+
+    def send_raw_transaction(self, nonce: int) -> HexBytes:
+        if nonce in self.sent_nonces:
+            raise ValueError({'code': -32000, 'message': 'replacement transaction underpriced'})
+
+        if nonce < self.pending_nonce:
+            raise ValueError({'code': -32000, 'message': 'nonce too low'})
+
+        self.sent_nonces.append(nonce)
+        self.pending_nonce = nonce + 1
+
+        if self.drop_response:
+            self.drop_response = False
+            raise TimeoutError('Transaction is sent, but the response is lost')
+
+        return HexBytes(nonce)